@@ -86,9 +86,10 @@ class XGBLearner(AbstractLearner):
         self.classifier = None
         self.importance = None
         self.xgb_hyperparams = xgb_hyperparams
-        self.xgb_params = xgb_params
+        # Copy, as the caller may pass a read-only mapping and tuning updates the parameters in place
+        self.xgb_params = dict(xgb_params)
         self.xgb_params_space = xgb_params_space
-        self.xgb_params_tuned = xgb_params
+        self.xgb_params_tuned = self.xgb_params
         self.threads = threads
         self.xgb_params['nthread'] = self.threads
 
@@ -93,7 +93,7 @@ def is_sqlite_file(filename):
 def check_sqlite_table(con, table):
     table_present = False
     c = con.cursor()
-    c.execute('SELECT count(name) FROM sqlite_master WHERE type="table" AND name="%s"' % table)
+    c.execute("SELECT count(name) FROM sqlite_master WHERE type='table' AND name=?", (table,))
     if c.fetchone()[0] == 1:
         table_present = True
     else:
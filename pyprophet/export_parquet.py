@@ -1,6 +1,7 @@
 import gc
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 import duckdb
 import sqlite3
 import numpy as np
@@ -34,6 +35,17 @@ def load_sqlite_scanner(conn: duckdb.DuckDBPyConnection):
         else:
             raise e
 
+def copy_to_parquet(conn: duckdb.DuckDBPyConnection, query: str, path: str, compression_method: str, compression_level: int):
+    """
+    Streams the result of `query` to a parquet file at `path` on its own DuckDB cursor, so several copies can run concurrently on the same connection.
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"COPY ({query}) TO '{path}' (FORMAT 'parquet', COMPRESSION '{compression_method}', COMPRESSION_LEVEL {compression_level});")
+    finally:
+        cursor.close()
+
+
 def get_table_columns(sqlite_file: str, table: str) -> list:
     with sqlite3.connect(sqlite_file) as conn:
         return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
@@ -298,7 +310,7 @@ def convert_osw_to_parquet(
     infile: str,
     outfile: str,
     compression_method: str = "zstd",
-    compression_level: int = 11,
+    compression_level: int = 3,
     split_transition_data: bool = True
 ):
     """
@@ -328,7 +340,7 @@ def convert_osw_to_parquet(
         infile: (str) path to osw sqlite file
         outfile: (str) path to write out parquet file
         compression_method: (str) compression method for parquet file (default: 'zstd')
-        compression_level: (int) compression level for parquet file (default: 11)
+        compression_level: (int) compression level for parquet file (default: 3, use 11 for archival at a much slower encode)
         split_transition_data: (bool) if True, will split the transition data into a separate file. If False, will combine the transition data with the precursor data. (default: True)
 
     Return:
@@ -377,8 +389,6 @@ def convert_osw_to_parquet(
     if split_transition_data:
         os.makedirs(outfile, exist_ok=True)
         
-        click.echo("Info: Writing precursor data...")
-        
         path = os.path.join(outfile, "precursors_features.parquet")
         
         precursor_template = """
@@ -481,15 +491,9 @@ def convert_osw_to_parquet(
             feature_ms2_cols_sql=feature_ms2_cols_sql,
         )
 
-        copy_query = f"COPY ({precursor_query}) TO '{path}' (FORMAT 'parquet', COMPRESSION '{compression_method}', COMPRESSION_LEVEL {compression_level});"
+        # Precursor and transition tables are independent, write them concurrently
+        copies = [(precursor_query, path)]
 
-        # Execute the COPY query in DuckDB — this streams directly to disk
-        conn.execute(copy_query)
-
-        click.echo(
-            "Info: Writing transition data..."
-        )
-        
         path = os.path.join(outfile, "transition_features.parquet")
 
         transition_template = """
@@ -532,9 +536,15 @@ def convert_osw_to_parquet(
             feature_transition_cols_sql=feature_transition_cols_sql,
         )
 
-        copy_transition_query = f"COPY ({transition_query}) TO '{path}' (FORMAT 'parquet', COMPRESSION '{compression_method}', COMPRESSION_LEVEL {compression_level});"
+        copies.append((transition_query, path))
+
+        click.echo("Info: Writing precursor and transition data...")
 
-        conn.execute(copy_transition_query)
+        # Each COPY streams directly to disk on its own cursor
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(copy_to_parquet, conn, query, path, compression_method, compression_level) for query, path in copies]
+            for future in futures:
+                future.result()
         
         if feature_ms2_alignment_table_exists:
             click.echo(
@@ -715,7 +725,7 @@ def convert_osw_to_parquet(
     
 
 def convert_sqmass_to_parquet(
-    infile, outfile, oswfile, compression_method="zstd", compression_level=11
+    infile, outfile, oswfile, compression_method="zstd", compression_level=3
 ):
     '''
     Convert a SQMass sqlite file to Parquet format
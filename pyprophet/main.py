@@ -1,29 +1,50 @@
-import pandas as pd
-import numpy as np
 import click
-import sys
 import os
 import pathlib
-import shutil
-import ast
-import time
-
-from .runner import PyProphetLearner, PyProphetWeightApplier
-from .ipf import infer_peptidoforms
-from .levels_contexts import infer_glycopeptides, infer_peptides, infer_proteins, infer_genes, subsample_osw, reduce_osw, merge_osw, backpropagate_oswr
-from .glyco.glycoform import infer_glycoforms
-from .split import split_osw
-from .export import export_tsv, export_score_plots
-from .export_compound import export_compound_tsv
-from .glyco.export import export_tsv as export_glyco_tsv, export_score_plots as export_glyco_score_plots
-from .filter import filter_sqmass, filter_osw
-from .data_handling import (transform_pi0_lambda, transform_threads, transform_subsample_ratio, check_sqlite_table)
-from .export_parquet import export_to_parquet, convert_osw_to_parquet, convert_sqmass_to_parquet
-from functools import update_wrapper
 import sqlite3
-from tabulate import tabulate
+from types import MappingProxyType
+
+# Default XGBoost parameters, shared read-only across score invocations
+_BASE_XGB_PARAMS = MappingProxyType({'eta': 0.3, 'gamma': 0, 'max_depth': 6, 'min_child_weight': 1, 'subsample': 1, 'colsample_bytree': 1, 'colsample_bylevel': 1, 'colsample_bynode': 1, 'lambda': 1, 'alpha': 0, 'scale_pos_weight': 1, 'verbosity': 0, 'objective': 'binary:logitraw', 'nthread': 1, 'eval_metric': 'auc'})
+
+# Choices shared by several commands
+_COLOR = click.Choice(('normal', 'protan', 'deutran', 'tritan'))
+_CONTEXT = click.Choice(('run-specific', 'experiment-wide', 'global'))
+_PI0_METHOD = click.Choice(('smoother', 'bootstrap'))
+_LFDR_TRANS = click.Choice(('probit', 'logit'))
+_DENSITY = click.Choice(('kde', 'gmm'))
+
+
+def _data_handling_callback(name):
+    """
+    Click callback deferring to pyprophet.data_handling, which pulls in pandas and scipy, until an option is actually processed.
+    """
+    def callback(ctx, param, value):
+        from . import data_handling
+        return getattr(data_handling, name)(ctx, param, value)
+    return callback
+
+transform_pi0_lambda = _data_handling_callback('transform_pi0_lambda')
+transform_threads = _data_handling_callback('transform_threads')
+transform_subsample_ratio = _data_handling_callback('transform_subsample_ratio')
+
+
+def _repeated_values(ctx, param, value):
+    """
+    Click callback for repeatable options, rejecting the former bracketed list form instead of taking it as a single value.
+    """
+    for item in value:
+        if item.lstrip().startswith('['):
+            raise click.BadParameter("'%s' looks like a list, repeat the flag once per value instead, e.g. %s A %s B" % (item, param.opts[0], param.opts[0]), ctx=ctx, param=param)
+    return list(value)
+
+
+def _with_ext(infile, ext):
+    """
+    Path of infile with its extension replaced by ext.
+    """
+    return os.path.splitext(infile)[0] + ext
 
-from hyperopt import hp
 
 try:
     profile
@@ -41,15 +62,26 @@ def cli():
     Visit http://openswath.org for usage instructions and help.
     """
 
-# https://stackoverflow.com/a/47730333
-class PythonLiteralOption(click.Option):
-    def type_cast_value(self, ctx, value):
-        if not isinstance(value, str):  # required for Click>=8.0.0
-            return value
-        try:
-            return ast.literal_eval(value)
-        except Exception:
-            raise click.BadParameter(value)
+
+def error_rate_options(f):
+    """
+    Shared error-rate estimation options (p-value, pi0 and local FDR) of the scoring and inference commands.
+    """
+    for option in reversed([
+        click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.'),
+        click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.'),
+        click.option('--pi0_lambda', default=(0.1, 0.5, 0.05), show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda),
+        click.option('--pi0_method', default='bootstrap', show_default=True, type=_PI0_METHOD, help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.'),
+        click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.'),
+        click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.'),
+        click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.'),
+        click.option('--lfdr_monotone/--no-lfdr_monotone', show_default=True, default=True, help='If True, local FDR values are non-decreasing with increasing p-values.'),
+        click.option('--lfdr_transformation', default='probit', show_default=True, type=_LFDR_TRANS, help='Either a "probit" or "logit" transformation is applied to the p-values so that a local FDR estimate can be formed that does not involve edge effects of the [0,1] interval in which the p-values lie.'),
+        click.option('--lfdr_adj', default=1.5, show_default=True, type=float, help='Numeric value that is applied as a multiple of the smoothing bandwidth used in the density estimation.'),
+        click.option('--lfdr_eps', default=1e-8, show_default=True, type=float, help='Numeric value that is threshold for the tails of the empirical p-value distribution.'),
+    ]):
+        f = option(f)
+    return f
 
 
 # PyProphet semi-supervised learning and scoring
@@ -71,17 +103,7 @@ class PythonLiteralOption(click.Option):
 @click.option('--ss_score_filter', default='', help='Specify scores which should used for scoring. In addition specific predefined profiles can be used. For example for metabolomis data use "metabolomics".  Please specify any additional input as follows: "var_ms1_xcorr_coelution,var_library_corr,var_xcorr_coelution,etc."')
 # Statistics
 @click.option('--group_id', default="group_id", show_default=True, type=str, help='Group identifier for calculation of statistics.')
-@click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.')
-@click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.')
-@click.option('--pi0_lambda', default=[0.1,0.5,0.05], show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
-@click.option('--pi0_method', default='bootstrap', show_default=True, type=click.Choice(['smoother', 'bootstrap']), help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
-@click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.')
-@click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.')
-@click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.')
-@click.option('--lfdr_monotone/--no-lfdr_monotone', show_default=True, default=True, help='If True, local FDR values are non-decreasing with increasing p-values.')
-@click.option('--lfdr_transformation', default='probit', show_default=True, type=click.Choice(['probit', 'logit']), help='Either a "probit" or "logit" transformation is applied to the p-values so that a local FDR estimate can be formed that does not involve edge effects of the [0,1] interval in which the p-values lie.')
-@click.option('--lfdr_adj', default=1.5, show_default=True, type=float, help='Numeric value that is applied as a multiple of the smoothing bandwidth used in the density estimation.')
-@click.option('--lfdr_eps', default=np.power(10.0,-8), show_default=True, type=float, help='Numeric value that is threshold for the tails of the empirical p-value distribution.')
+@error_rate_options
 # OpenSWATH options
 @click.option('--level', default='ms2', show_default=True, type=click.Choice(['ms1', 'ms2', 'ms1ms2', 'transition', 'alignment']), help='Either "ms1", "ms2", "ms1ms2", "transition", or "alignment"; the data level selected for scoring. "ms1ms2 integrates both MS1- and MS2-level scores and can be used instead of "ms2"-level results."')
 @click.option('--add_alignment_features/--no-add_alignment_features', default=False, show_default=True, help='Add alignment features to scoring.')
@@ -92,12 +114,12 @@ class PythonLiteralOption(click.Option):
 @click.option('--ipf_min_transition_sn', default=0, show_default=True, type=float, help='Minimum log signal-to-noise level to consider transitions in IPF. Set -1 to disable this filter.')
 # Glyco/GproDIA Options
 @click.option('--glyco/--no-glyco', default=False, show_default=True, help='Whether glycopeptide scoring should be enabled.')
-@click.option('--density_estimator', default='gmm', show_default=True, type=click.Choice(['kde', 'gmm']), help='Either kernel density estimation ("kde") or Gaussian mixture model ("gmm") is used for score density estimation.')
+@click.option('--density_estimator', default='gmm', show_default=True, type=_DENSITY, help='Either kernel density estimation ("kde") or Gaussian mixture model ("gmm") is used for score density estimation.')
 @click.option('--grid_size', default=256, show_default=True, type=int, help='Number of d-score cutoffs to build grid coordinates for local FDR calculation.')
 # TRIC
 @click.option('--tric_chromprob/--no-tric_chromprob', default=False, show_default=True, help='Whether chromatogram probabilities for TRIC should be computed.')
 # Visualization
-@click.option('--color_palette', default='normal', show_default=True, type=click.Choice(['normal', 'protan', 'deutran', 'tritan']), help='Color palette to use in reports.')
+@click.option('--color_palette', default='normal', show_default=True, type=_COLOR, help='Color palette to use in reports.')
 @click.option('--main_score_selection_report/--no-main_score_selection_report', default=False, show_default=True, help='Generate a report for main score selection process.')
 # Processing
 @click.option('--threads', default=1, show_default=True, type=int, help='Number of threads used for semi-supervised learning. -1 means all available CPUs.', callback=transform_threads)
@@ -145,26 +167,51 @@ def score(
     """
     Conduct semi-supervised learning and error-rate estimation for MS1, MS2 and transition-level data. 
     """
+    from .runner import ScoreConfig, PyProphetLearner, PyProphetWeightApplier
 
     if outfile is None:
         outfile = infile
     else:
         outfile = outfile
 
-    # Prepare XGBoost-specific parameters
-    xgb_hyperparams = {'autotune': xgb_autotune, 'autotune_num_rounds': 10, 'num_boost_round': 100, 'early_stopping_rounds': 10, 'test_size': 0.33}
+    # Prepare XGBoost-specific parameters (not required for LDA)
+    if classifier == 'XGBoost':
+        from hyperopt import hp
 
-    xgb_params = {'eta': 0.3, 'gamma': 0, 'max_depth': 6, 'min_child_weight': 1, 'subsample': 1, 'colsample_bytree': 1, 'colsample_bylevel': 1, 'colsample_bynode': 1, 'lambda': 1, 'alpha': 0, 'scale_pos_weight': 1, 'verbosity': 0, 'objective': 'binary:logitraw', 'nthread': 1, 'eval_metric': 'auc'}
-    if test:
-        xgb_params['tree_method'] = 'exact'
+        xgb_hyperparams = {'autotune': xgb_autotune, 'autotune_num_rounds': 10, 'num_boost_round': 100, 'early_stopping_rounds': 10, 'test_size': 0.33}
 
-    xgb_params_space = {'eta': hp.uniform('eta', 0.0, 0.3), 'gamma': hp.uniform('gamma', 0.0, 0.5), 'max_depth': hp.quniform('max_depth', 2, 8, 1), 'min_child_weight': hp.quniform('min_child_weight', 1, 5, 1), 'subsample': 1, 'colsample_bytree': 1, 'colsample_bylevel': 1, 'colsample_bynode': 1, 'lambda': hp.uniform('lambda', 0.0, 1.0), 'alpha': hp.uniform('alpha', 0.0, 1.0), 'scale_pos_weight': 1.0, 'verbosity': 0, 'objective': 'binary:logitraw', 'nthread': 1, 'eval_metric': 'auc'}
+        xgb_params = MappingProxyType({**_BASE_XGB_PARAMS, **({'tree_method': 'exact'} if test else {})})
 
-    if not apply_weights:
-        PyProphetLearner(infile, outfile, classifier, xgb_hyperparams, xgb_params, xgb_params_space, xeval_fraction, xeval_num_iter, ss_initial_fdr, ss_iteration_fdr, ss_num_iter, ss_main_score, group_id, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, level, add_alignment_features, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn, glyco, density_estimator, grid_size, tric_chromprob, threads, test, ss_score_filter, color_palette, main_score_selection_report).run()
+        xgb_params_space = {'eta': hp.uniform('eta', 0.0, 0.3), 'gamma': hp.uniform('gamma', 0.0, 0.5), 'max_depth': hp.quniform('max_depth', 2, 8, 1), 'min_child_weight': hp.quniform('min_child_weight', 1, 5, 1), 'subsample': 1, 'colsample_bytree': 1, 'colsample_bylevel': 1, 'colsample_bynode': 1, 'lambda': hp.uniform('lambda', 0.0, 1.0), 'alpha': hp.uniform('alpha', 0.0, 1.0), 'scale_pos_weight': 1.0, 'verbosity': 0, 'objective': 'binary:logitraw', 'nthread': 1, 'eval_metric': 'auc'}
     else:
+        xgb_hyperparams = xgb_params = xgb_params_space = None
+
+    config = ScoreConfig(
+        infile=infile, outfile=outfile, classifier=classifier,
+        xgb_hyperparams=xgb_hyperparams, xgb_params=xgb_params, xgb_params_space=xgb_params_space,
+        xeval_fraction=xeval_fraction, xeval_num_iter=xeval_num_iter,
+        ss_initial_fdr=ss_initial_fdr, ss_iteration_fdr=ss_iteration_fdr, ss_num_iter=ss_num_iter,
+        ss_main_score=ss_main_score, group_id=group_id,
+        parametric=parametric, pfdr=pfdr,
+        pi0_lambda=pi0_lambda, pi0_method=pi0_method,
+        pi0_smooth_df=pi0_smooth_df, pi0_smooth_log_pi0=pi0_smooth_log_pi0,
+        lfdr_truncate=lfdr_truncate, lfdr_monotone=lfdr_monotone,
+        lfdr_transformation=lfdr_transformation, lfdr_adj=lfdr_adj, lfdr_eps=lfdr_eps,
+        level=level, add_alignment_features=add_alignment_features,
+        ipf_max_peakgroup_rank=ipf_max_peakgroup_rank, ipf_max_peakgroup_pep=ipf_max_peakgroup_pep,
+        ipf_max_transition_isotope_overlap=ipf_max_transition_isotope_overlap,
+        ipf_min_transition_sn=ipf_min_transition_sn,
+        glyco=glyco, density_estimator=density_estimator, grid_size=grid_size,
+        tric_chromprob=tric_chromprob, threads=threads, test=test,
+        ss_score_filter=ss_score_filter, color_palette=color_palette,
+        main_score_selection_report=main_score_selection_report,
+        apply_weights=apply_weights,
+    )
 
-        PyProphetWeightApplier(infile, outfile, classifier, xgb_hyperparams, xgb_params, xgb_params_space, xeval_fraction, xeval_num_iter, ss_initial_fdr, ss_iteration_fdr, ss_num_iter, ss_main_score, group_id, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, level, add_alignment_features, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn, glyco, density_estimator, grid_size, tric_chromprob, threads, test, apply_weights, ss_score_filter, color_palette, main_score_selection_report).run()
+    if not apply_weights:
+        PyProphetLearner(config).run()
+    else:
+        PyProphetWeightApplier(config).run()
 
 
 # IPF
@@ -188,6 +235,7 @@ def ipf(infile, outfile, ipf_ms1_scoring, ipf_ms2_scoring, ipf_h0, ipf_grouped_f
     """
     Infer peptidoforms after scoring of MS1, MS2 and transition-level data.
     """
+    from .ipf import infer_peptidoforms
 
     if outfile is None:
         outfile = infile
@@ -230,6 +278,7 @@ def glycoform(infile, outfile,
     """
     Infer glycoforms after scoring of MS1, MS2 and transition-level data.
     """
+    from .glyco.glycoform import infer_glycoforms
     
     if outfile is None:
         outfile = infile
@@ -258,25 +307,16 @@ def glycoform(infile, outfile,
 @click.option('--in', 'infile', required=True, type=click.Path(exists=True), help='PyProphet input file. Valid formats are .osw, .parquet (produced by export_parquet with `--scoring_format`)')
 @click.option('--out', 'outfile', type=click.Path(exists=False), help='PyProphet output file.  Valid formats are .osw, .parquet. Must be the same format as input file.')
 # Context
-@click.option('--context', default='run-specific', show_default=True, type=click.Choice(['run-specific', 'experiment-wide', 'global']), help='Context to estimate protein-level FDR control.')
+@click.option('--context', default='run-specific', show_default=True, type=_CONTEXT, help='Context to estimate protein-level FDR control.')
 # Statistics
-@click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.')
-@click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.')
-@click.option('--pi0_lambda', default=[0.1,0.5,0.05], show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
-@click.option('--pi0_method', default='bootstrap', show_default=True, type=click.Choice(['smoother', 'bootstrap']), help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
-@click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.')
-@click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.')
-@click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.')
-@click.option('--lfdr_monotone/--no-lfdr_monotone', show_default=True, default=True, help='If True, local FDR values are non-decreasing with increasing p-values.')
-@click.option('--lfdr_transformation', default='probit', show_default=True, type=click.Choice(['probit', 'logit']), help='Either a "probit" or "logit" transformation is applied to the p-values so that a local FDR estimate can be formed that does not involve edge effects of the [0,1] interval in which the p-values lie.')
-@click.option('--lfdr_adj', default=1.5, show_default=True, type=float, help='Numeric value that is applied as a multiple of the smoothing bandwidth used in the density estimation.')
-@click.option('--lfdr_eps', default=np.power(10.0,-8), show_default=True, type=float, help='Numeric value that is threshold for the tails of the empirical p-value distribution.')
+@error_rate_options
 # Visualization
-@click.option('--color_palette', default='normal', show_default=True, type=click.Choice(['normal', 'protan', 'deutran', 'tritan']), help='Color palette to use in reports.')
+@click.option('--color_palette', default='normal', show_default=True, type=_COLOR, help='Color palette to use in reports.')
 def peptide(infile, outfile, context, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, color_palette):
     """
     Infer peptides and conduct error-rate estimation in different contexts.
     """
+    from .levels_contexts import infer_peptides
 
     if outfile is None:
         outfile = infile
@@ -290,13 +330,13 @@ def peptide(infile, outfile, context, parametric, pfdr, pi0_lambda, pi0_method,
 @cli.command()
 @click.option('--in', 'infile', required=True, type=click.Path(exists=True), help='Input file.')
 @click.option('--out', 'outfile', type=click.Path(exists=False), help='Output file.')
-@click.option('--context', default='run-specific', show_default=True, type=click.Choice(['run-specific', 'experiment-wide', 'global']), help='Context to estimate glycopeptide-level FDR control.')
-@click.option('--density_estimator', default='gmm', show_default=True, type=click.Choice(['kde', 'gmm']), help='Either kernel density estimation ("kde") or Gaussian mixture model ("gmm") is used for score density estimation.')
+@click.option('--context', default='run-specific', show_default=True, type=_CONTEXT, help='Context to estimate glycopeptide-level FDR control.')
+@click.option('--density_estimator', default='gmm', show_default=True, type=_DENSITY, help='Either kernel density estimation ("kde") or Gaussian mixture model ("gmm") is used for score density estimation.')
 @click.option('--grid_size', default=256, show_default=True, type=int, help='Number of d-score cutoffs to build grid coordinates for local FDR calculation.')
 @click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.')
 @click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.')
-@click.option('--pi0_lambda', default=[0.1,0.5,0.05], show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
-@click.option('--pi0_method', default='bootstrap', show_default=True, type=click.Choice(['smoother', 'bootstrap']), help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
+@click.option('--pi0_lambda', default=(0.1, 0.5, 0.05), show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
+@click.option('--pi0_method', default='bootstrap', show_default=True, type=_PI0_METHOD, help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
 @click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.')
 @click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.')
 @click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.')
@@ -305,6 +345,7 @@ def glycopeptide(infile, outfile, context, density_estimator, grid_size, paramet
     """
     Infer glycopeptides and conduct error-rate estimation in different contexts.
     """
+    from .levels_contexts import infer_glycopeptides
     if outfile is None:
         outfile = infile
     
@@ -327,25 +368,16 @@ def glycopeptide(infile, outfile, context, density_estimator, grid_size, paramet
 @click.option('--in', 'infile', required=True, type=click.Path(exists=True), help='PyProphet input file.  Valid formats are .osw, .parquet (produced by export_parquet with `--scoring_format`)')
 @click.option('--out', 'outfile', type=click.Path(exists=False), help='PyProphet output file.  Valid formats are .osw, .parquet. Must be the same format as input file.')
 # Context
-@click.option('--context', default='run-specific', show_default=True, type=click.Choice(['run-specific', 'experiment-wide', 'global']), help='Context to estimate gene-level FDR control.')
+@click.option('--context', default='run-specific', show_default=True, type=_CONTEXT, help='Context to estimate gene-level FDR control.')
 # Statistics
-@click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.')
-@click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.')
-@click.option('--pi0_lambda', default=[0.1,0.5,0.05], show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
-@click.option('--pi0_method', default='bootstrap', show_default=True, type=click.Choice(['smoother', 'bootstrap']), help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
-@click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.')
-@click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.')
-@click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.')
-@click.option('--lfdr_monotone/--no-lfdr_monotone', show_default=True, default=True, help='If True, local FDR values are non-decreasing with increasing p-values.')
-@click.option('--lfdr_transformation', default='probit', show_default=True, type=click.Choice(['probit', 'logit']), help='Either a "probit" or "logit" transformation is applied to the p-values so that a local FDR estimate can be formed that does not involve edge effects of the [0,1] interval in which the p-values lie.')
-@click.option('--lfdr_adj', default=1.5, show_default=True, type=float, help='Numeric value that is applied as a multiple of the smoothing bandwidth used in the density estimation.')
-@click.option('--lfdr_eps', default=np.power(10.0,-8), show_default=True, type=float, help='Numeric value that is threshold for the tails of the empirical p-value distribution.')
+@error_rate_options
 # Visualization
-@click.option('--color_palette', default='normal', show_default=True, type=click.Choice(['normal', 'protan', 'deutran', 'tritan']), help='Color palette to use in reports.')
+@click.option('--color_palette', default='normal', show_default=True, type=_COLOR, help='Color palette to use in reports.')
 def gene(infile, outfile, context, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, color_palette):
     """
     Infer genes and conduct error-rate estimation in different contexts.
     """
+    from .levels_contexts import infer_genes
 
     if outfile is None:
         outfile = infile
@@ -360,25 +392,16 @@ def gene(infile, outfile, context, parametric, pfdr, pi0_lambda, pi0_method, pi0
 @click.option('--in', 'infile', required=True, type=click.Path(exists=True), help='PyProphet input file.  Valid formats are .osw, .parquet (produced by export_parquet with `--scoring_format`)')
 @click.option('--out', 'outfile', type=click.Path(exists=False), help='PyProphet output file.  Valid formats are .osw, .parquet. Must be the same format as input file.')
 # Context
-@click.option('--context', default='run-specific', show_default=True, type=click.Choice(['run-specific', 'experiment-wide', 'global']), help='Context to estimate protein-level FDR control.')
+@click.option('--context', default='run-specific', show_default=True, type=_CONTEXT, help='Context to estimate protein-level FDR control.')
 # Statistics
-@click.option('--parametric/--no-parametric', default=False, show_default=True, help='Do parametric estimation of p-values.')
-@click.option('--pfdr/--no-pfdr', default=False, show_default=True, help='Compute positive false discovery rate (pFDR) instead of FDR.')
-@click.option('--pi0_lambda', default=[0.1,0.5,0.05], show_default=True, type=(float, float, float), help='Use non-parametric estimation of p-values. Either use <START END STEPS>, e.g. 0.1, 1.0, 0.1 or set to fixed value, e.g. 0.4, 0, 0.', callback=transform_pi0_lambda)
-@click.option('--pi0_method', default='bootstrap', show_default=True, type=click.Choice(['smoother', 'bootstrap']), help='Either "smoother" or "bootstrap"; the method for automatically choosing tuning parameter in the estimation of pi_0, the proportion of true null hypotheses.')
-@click.option('--pi0_smooth_df', default=3, show_default=True, type=int, help='Number of degrees-of-freedom to use when estimating pi_0 with a smoother.')
-@click.option('--pi0_smooth_log_pi0/--no-pi0_smooth_log_pi0', default=False, show_default=True, help='If True and pi0_method = "smoother", pi0 will be estimated by applying a smoother to a scatterplot of log(pi0) estimates against the tuning parameter lambda.')
-@click.option('--lfdr_truncate/--no-lfdr_truncate', show_default=True, default=True, help='If True, local FDR values >1 are set to 1.')
-@click.option('--lfdr_monotone/--no-lfdr_monotone', show_default=True, default=True, help='If True, local FDR values are non-decreasing with increasing p-values.')
-@click.option('--lfdr_transformation', default='probit', show_default=True, type=click.Choice(['probit', 'logit']), help='Either a "probit" or "logit" transformation is applied to the p-values so that a local FDR estimate can be formed that does not involve edge effects of the [0,1] interval in which the p-values lie.')
-@click.option('--lfdr_adj', default=1.5, show_default=True, type=float, help='Numeric value that is applied as a multiple of the smoothing bandwidth used in the density estimation.')
-@click.option('--lfdr_eps', default=np.power(10.0,-8), show_default=True, type=float, help='Numeric value that is threshold for the tails of the empirical p-value distribution.')
+@error_rate_options
 # Visualization
-@click.option('--color_palette', default='normal', show_default=True, type=click.Choice(['normal', 'protan', 'deutran', 'tritan']), help='Color palette to use in reports.')
+@click.option('--color_palette', default='normal', show_default=True, type=_COLOR, help='Color palette to use in reports.')
 def protein(infile, outfile, context, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, color_palette):
     """
     Infer proteins and conduct error-rate estimation in different contexts.
     """
+    from .levels_contexts import infer_proteins
 
     if outfile is None:
         outfile = infile
@@ -398,6 +421,7 @@ def subsample(infile, outfile, subsample_ratio, test):
     """
     Subsample OpenSWATH file to minimum for integrated scoring
     """
+    from .levels_contexts import subsample_osw
 
     if outfile is None:
         outfile = infile
@@ -415,6 +439,7 @@ def reduce(infile, outfile):
     """
     Reduce scored PyProphet file to minimum for global scoring
     """
+    from .levels_contexts import reduce_osw
 
     if outfile is None:
         outfile = infile
@@ -435,6 +460,7 @@ def merge(infiles, outfile, same_run, templatefile, merged_post_scored_runs):
     """
     Merge multiple OSW files and (for large experiments, it is recommended to subsample first).
     """
+    from .levels_contexts import merge_osw
 
     if len(infiles) < 1:
         raise click.ClickException("At least one PyProphet input file needs to be provided.")
@@ -449,6 +475,8 @@ def split(infile, threads):
     """
     Split a merged OSW file into single runs.
     """
+    from .split import split_osw
+
     split_osw(infile, threads)
 
 # Backpropagate multi-run peptide and protein scores to single files
@@ -460,6 +488,7 @@ def backpropagate(infile, outfile, apply_scores):
     """
     Backpropagate multi-run peptide and protein scores to single files
     """
+    from .levels_contexts import backpropagate_oswr
 
     if outfile is None:
         outfile = infile
@@ -517,15 +546,18 @@ def export(
     """
     Export TSV/CSV tables
     """
+    from .export import export_tsv, export_score_plots
+    from .glyco.export import export_tsv as export_glyco_tsv, export_score_plots as export_glyco_score_plots
+
     if glycoform:
         if format == "score_plots":
             export_glyco_score_plots(infile)
         else:
             if outfile is None:
                 if outcsv:
-                    outfile = infile.split(".osw")[0] + ".csv"
+                    outfile = _with_ext(infile, ".csv")
                 else:
-                    outfile = infile.split(".osw")[0] + ".tsv"
+                    outfile = _with_ext(infile, ".tsv")
             else:
                 outfile = outfile
 
@@ -548,9 +580,9 @@ def export(
         else:
             if outfile is None:
                 if outcsv:
-                    outfile = infile.split(".osw")[0] + ".csv"
+                    outfile = _with_ext(infile, ".csv")
                 else:
-                    outfile = infile.split(".osw")[0] + ".tsv"
+                    outfile = _with_ext(infile, ".tsv")
             else:
                 outfile = outfile
 
@@ -569,7 +601,8 @@ def export(
 @click.option('--scoring_format', 'scoring_format', is_flag=True, help='Convert OSW to parquet format that is compatible with the scoring/inference modules')
 @click.option('--split_transition_data/--no-split_transition_data', 'split_transition_data', default=False, show_default=True, help='Split transition data into a separate parquet (default: True).')
 @click.option('--compression', 'compression', default='zstd', show_default=True, type=click.Choice(['lz4', 'uncompressed', 'snappy', 'gzip', 'lzo', 'brotli', 'zstd']), help='Compression algorithm to use for parquet file.')
-@click.option('--compression_level', 'compression_level', default=11, show_default=True, type=int, help='Compression level to use for parquet file.')
+@click.option('--compression_level', 'compression_level', default=3, show_default=True, type=int, help='Compression level to use for parquet file. Higher zstd levels (e.g. 11) encode much slower for a small size gain, use them for archival.')
+@click.option('--force/--no-force', 'force', default=False, show_default=True, help='[format: scoring] Overwrite an existing output without asking.')
 def export_parquet(
     infile,
     outfile,
@@ -580,24 +613,38 @@ def export_parquet(
     scoring_format,
     split_transition_data,
     compression,
-    compression_level
+    compression_level,
+    force
 ):
     """
     Export OSW or sqMass to parquet format
     """
+    import shutil
+    import time
+    from .export_parquet import export_to_parquet, convert_osw_to_parquet, convert_sqmass_to_parquet
+
+    # Make paths absolute without following symlinks, so extensions and default output names follow the path as given
+    infile = os.path.abspath(infile)
+    if outfile is not None:
+        outfile = os.path.abspath(outfile)
+
     # Check if the input file has an .osw extension
     if infile.endswith(".osw"):
         if scoring_format:
             click.echo("Info: Will export OSW to parquet scoring format")
             if os.path.exists(outfile):
-                click.echo(
-                    click.style(
-                        f"Warn: {outfile} already exists, will overwrite/delete",
-                        fg="yellow",
+                if force:
+                    click.echo(
+                        click.style(
+                            f"Warn: {outfile} already exists, will overwrite/delete",
+                            fg="yellow",
+                        )
+                    )
+                else:
+                    click.confirm(
+                        f"{outfile} already exists, would you like to overwrite/delete it?",
+                        abort=True,
                     )
-                )
-
-                time.sleep(10)
 
                 if os.path.isdir(outfile):
                     shutil.rmtree(outfile)
@@ -626,7 +673,7 @@ def export_parquet(
             if transitionLevel:
                 click.echo("Info: Will export transition level data")
             if outfile is None:
-                outfile = infile.split(".osw")[0] + ".parquet"
+                outfile = _with_ext(infile, ".parquet")
             if os.path.exists(outfile):
                 overwrite = click.confirm(
                     f"{outfile} already exists, would you like to overwrite?"
@@ -635,8 +682,8 @@ def export_parquet(
                     raise click.ClickException(f"Aborting: {outfile} already exists!")
             click.echo("Info: Parquet file will be written to {}".format(outfile))
             export_to_parquet(
-                os.path.abspath(infile),
-                os.path.abspath(outfile),
+                infile,
+                outfile,
                 transitionLevel,
                 onlyFeatures,
                 noDecoys,
@@ -678,14 +725,17 @@ def export_compound(infile, outfile, format, outcsv, max_rs_peakgroup_qvalue):
     """
     Export Compound TSV/CSV tables
     """
+    from .export import export_score_plots
+    from .export_compound import export_compound_tsv
+
     if format == "score_plots":
         export_score_plots(infile)
     else:
         if outfile is None:
             if outcsv:
-                outfile = infile.split(".osw")[0] + ".csv"
+                outfile = _with_ext(infile, ".csv")
             else:
-                outfile = infile.split(".osw")[0] + ".tsv"
+                outfile = _with_ext(infile, ".tsv")
         else:
             outfile = outfile
 
@@ -701,26 +751,29 @@ def export_compound(infile, outfile, format, outcsv, max_rs_peakgroup_qvalue):
 @click.option('--max_transition_pep', default=0.7, show_default=True, type=float, help='Maximum PEP to retain scored transitions in sqMass.')
 # OSW Filter File Handling
 @click.option('--remove_decoys/--no-remove_decoys', 'remove_decoys', default=True, show_default=True, help='Remove Decoys from OSW file.')
-@click.option('--omit_tables', default="[]", show_default=True, cls=PythonLiteralOption, help="""Tables in the database you do not want to copy over to filtered file. i.e. `--omit_tables '["FEATURE_TRANSITION", "SCORE_TRANSITION"]'`""")
+@click.option('--omit_table', '--omit_tables', 'omit_tables', multiple=True, default=(), callback=_repeated_values, help='Table in the database you do not want to copy over to filtered file, can be given multiple times. i.e. `--omit_table FEATURE_TRANSITION --omit_table SCORE_TRANSITION`')
 @click.option('--max_gene_fdr', default=None, show_default=True, type=float, help='Maximum QVALUE to retain scored genes in OSW.  [default: None]')
 @click.option('--max_protein_fdr', default=None, show_default=True, type=float, help='Maximum QVALUE to retain scored proteins in OSW.  [default: None]')
 @click.option('--max_peptide_fdr', default=None, show_default=True, type=float, help='Maximum QVALUE to retain scored peptides in OSW.  [default: None]')
 @click.option('--max_ms2_fdr', default=None, show_default=True, type=float, help='Maximum QVALUE to retain scored MS2 Features in OSW.  [default: None]')
-@click.option('--keep_naked_peptides', default="[]", show_default=True, cls=PythonLiteralOption, help="""Filter for specific UNMODIFIED_PEPTIDES. i.e. `--keep_naked_peptides '["ANSSPTTNIDHLK", "ESTAEPDSLSR"]'`""")
-@click.option('--run_ids', default="[]", show_default=True, cls=PythonLiteralOption, help="""Filter for specific RUN_IDs. i.e. `--run_ids '["8889961272137748833", "8627438106464817423"]'`""")
+@click.option('--keep_naked_peptide', '--keep_naked_peptides', 'keep_naked_peptides', multiple=True, default=(), callback=_repeated_values, help='Filter for a specific UNMODIFIED_PEPTIDE, can be given multiple times. i.e. `--keep_naked_peptide ANSSPTTNIDHLK --keep_naked_peptide ESTAEPDSLSR`')
+@click.option('--run_id', '--run_ids', 'run_ids', multiple=True, default=(), callback=_repeated_values, help='Filter for a specific RUN_ID, can be given multiple times. i.e. `--run_id 8889961272137748833 --run_id 8627438106464817423`')
 def filter(sqldbfiles, infile, max_precursor_pep, max_peakgroup_pep, max_transition_pep, remove_decoys, omit_tables, max_gene_fdr, max_protein_fdr, max_peptide_fdr, max_ms2_fdr, keep_naked_peptides, run_ids):
     """
     Filter sqMass files or osw files
     """
-        
-    if all([pathlib.PurePosixPath(file).suffix.lower()=='.sqmass' for file in sqldbfiles]):
+    from .filter import filter_sqmass, filter_osw
+
+    suffixes = {pathlib.PurePosixPath(file).suffix.lower() for file in sqldbfiles}
+
+    if suffixes == {'.sqmass'}:
         if infile is None and len(keep_naked_peptides) == 0:
-            click.ClickException("If you are filtering sqMass files, you need to provide a PyProphet file via `--in` flag or you need to provide a list of naked peptide sequences to filter for.")
+            raise click.ClickException("If you are filtering sqMass files, you need to provide a PyProphet file via `--in` flag or you need to provide a list of naked peptide sequences to filter for.")
         filter_sqmass(sqldbfiles, infile, max_precursor_pep, max_peakgroup_pep, max_transition_pep, keep_naked_peptides, remove_decoys)
-    elif all([pathlib.PurePosixPath(file).suffix.lower()=='.osw' for file in sqldbfiles]):
+    elif suffixes == {'.osw'}:
         filter_osw(sqldbfiles, remove_decoys, omit_tables, max_gene_fdr, max_protein_fdr, max_peptide_fdr, max_ms2_fdr, keep_naked_peptides, run_ids)
     else:
-        click.ClickException(f"There seems to be something wrong with the input sqlite db files. Make sure they are all either sqMass files or all OSW files, these are mutually exclusive.\nYour input files: {sqldbfiles}")
+        raise click.ClickException(f"There seems to be something wrong with the input sqlite db files. Make sure they are all either sqMass files or all OSW files, these are mutually exclusive.\nYour input files: {sqldbfiles}")
 
 # Print statistics
 @cli.command()
@@ -729,32 +782,60 @@ def statistics(infile):
     """
     Print PyProphet statistics
     """
+    from tabulate import tabulate
 
-    con = sqlite3.connect(infile)
+    # Open read-only with a large page cache and memory-mapped I/O for the joins below
+    con = sqlite3.connect(pathlib.Path(infile).resolve().as_uri() + '?mode=ro', uri=True)
+    con.executescript('''
+                      PRAGMA cache_size=-262144;
+                      PRAGMA mmap_size=4294967296;
+                      PRAGMA temp_store=MEMORY;
+                      PRAGMA query_only=1;
+                      ''')
 
     qts = [0.01, 0.05, 0.10]
 
-    for qt in qts:
-        if check_sqlite_table(con, 'SCORE_MS2'):
-            peakgroups = pd.read_sql('SELECT * FROM SCORE_MS2 INNER JOIN FEATURE ON SCORE_MS2.feature_id = FEATURE.id INNER JOIN PRECURSOR ON FEATURE.precursor_id = PRECURSOR.id INNER JOIN RUN ON FEATURE.RUN_ID = RUN.ID WHERE RANK==1 AND DECOY==0;' , con)
+    def count_ids(sql, id_col):
+        # Count the distinct ids passing each q-value threshold in a single pass, one column per threshold
+        counts = ', '.join(['COUNT(DISTINCT CASE WHEN QVALUE<? THEN %s END)' % id_col] * len(qts))
+        return con.execute(sql.format(counts=counts), qts + [max(qts)]).fetchall()
 
-            click.echo("Total peakgroups (q-value<%s): %s" % (qt, len(peakgroups[peakgroups['QVALUE']<qt][['FEATURE_ID']].drop_duplicates())))
-            click.echo("Total peakgroups per run (q-value<%s):" % qt)
-            click.echo(tabulate(peakgroups[peakgroups['QVALUE']<qt].groupby(['FILENAME'])['FEATURE_ID'].nunique().reset_index(), showindex=False))
-            click.echo(10*"=")
+    # Probe for all score tables at once
+    tables = {row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+    peakgroups_total = peakgroups = peptides_global = peptides = proteins_global = proteins = None
+
+    if 'SCORE_MS2' in tables:
+        peakgroups_total = count_ids('SELECT {counts} FROM SCORE_MS2 INNER JOIN FEATURE ON SCORE_MS2.FEATURE_ID = FEATURE.ID INNER JOIN PRECURSOR ON FEATURE.PRECURSOR_ID = PRECURSOR.ID INNER JOIN RUN ON FEATURE.RUN_ID = RUN.ID WHERE RANK==1 AND DECOY==0 AND QVALUE<?;', 'SCORE_MS2.FEATURE_ID')[0]
+        peakgroups = count_ids('SELECT RUN.FILENAME, {counts} FROM SCORE_MS2 INNER JOIN FEATURE ON SCORE_MS2.FEATURE_ID = FEATURE.ID INNER JOIN PRECURSOR ON FEATURE.PRECURSOR_ID = PRECURSOR.ID INNER JOIN RUN ON FEATURE.RUN_ID = RUN.ID WHERE RANK==1 AND DECOY==0 AND QVALUE<? GROUP BY RUN.FILENAME ORDER BY RUN.FILENAME;', 'SCORE_MS2.FEATURE_ID')
+
+    if 'SCORE_PEPTIDE' in tables:
+        peptides_global = count_ids('SELECT {counts} FROM SCORE_PEPTIDE INNER JOIN PEPTIDE ON SCORE_PEPTIDE.PEPTIDE_ID = PEPTIDE.ID WHERE CONTEXT=="global" AND DECOY==0 AND QVALUE<?;', 'SCORE_PEPTIDE.PEPTIDE_ID')[0]
+        peptides = count_ids('SELECT RUN.FILENAME, {counts} FROM SCORE_PEPTIDE INNER JOIN PEPTIDE ON SCORE_PEPTIDE.PEPTIDE_ID = PEPTIDE.ID INNER JOIN RUN ON SCORE_PEPTIDE.RUN_ID = RUN.ID WHERE DECOY==0 AND QVALUE<? GROUP BY RUN.FILENAME ORDER BY RUN.FILENAME;', 'SCORE_PEPTIDE.PEPTIDE_ID')
 
-        if check_sqlite_table(con, 'SCORE_PEPTIDE'):
-            peptides_global = pd.read_sql('SELECT * FROM SCORE_PEPTIDE INNER JOIN PEPTIDE ON SCORE_PEPTIDE.peptide_id = PEPTIDE.id WHERE CONTEXT=="global" AND DECOY==0;' , con)
-            peptides = pd.read_sql('SELECT * FROM SCORE_PEPTIDE INNER JOIN PEPTIDE ON SCORE_PEPTIDE.peptide_id = PEPTIDE.id INNER JOIN RUN ON SCORE_PEPTIDE.RUN_ID = RUN.ID WHERE DECOY==0;' , con)
+    if 'SCORE_PROTEIN' in tables:
+        proteins_global = count_ids('SELECT {counts} FROM SCORE_PROTEIN INNER JOIN PROTEIN ON SCORE_PROTEIN.PROTEIN_ID = PROTEIN.ID WHERE CONTEXT=="global" AND DECOY==0 AND QVALUE<?;', 'SCORE_PROTEIN.PROTEIN_ID')[0]
+        proteins = count_ids('SELECT RUN.FILENAME, {counts} FROM SCORE_PROTEIN INNER JOIN PROTEIN ON SCORE_PROTEIN.PROTEIN_ID = PROTEIN.ID INNER JOIN RUN ON SCORE_PROTEIN.RUN_ID = RUN.ID WHERE DECOY==0 AND QVALUE<? GROUP BY RUN.FILENAME ORDER BY RUN.FILENAME;', 'SCORE_PROTEIN.PROTEIN_ID')
 
-            click.echo("Total peptides (global context) (q-value<%s): %s" % (qt, len(peptides_global[peptides_global['QVALUE']<qt][['PEPTIDE_ID']].drop_duplicates())))
-            click.echo(tabulate(peptides[peptides['QVALUE']<qt].groupby(['FILENAME'])['PEPTIDE_ID'].nunique().reset_index(), showindex=False))
+    con.close()
+
+    def per_run(rows, i):
+        # Runs without any id passing the threshold are left out
+        return [(row[0], row[i + 1]) for row in rows if row[i + 1]]
+
+    for i, qt in enumerate(qts):
+        if peakgroups is not None:
+            click.echo("Total peakgroups (q-value<%s): %s" % (qt, peakgroups_total[i]))
+            click.echo("Total peakgroups per run (q-value<%s):" % qt)
+            click.echo(tabulate(per_run(peakgroups, i), headers=['FILENAME', 'COUNT']))
             click.echo(10*"=")
 
-        if check_sqlite_table(con, 'SCORE_PROTEIN'):
-            proteins_global = pd.read_sql('SELECT * FROM SCORE_PROTEIN INNER JOIN PROTEIN ON SCORE_PROTEIN.protein_id = PROTEIN.id WHERE CONTEXT=="global" AND DECOY==0;' , con)
-            proteins = pd.read_sql('SELECT * FROM SCORE_PROTEIN INNER JOIN PROTEIN ON SCORE_PROTEIN.protein_id = PROTEIN.id INNER JOIN RUN ON SCORE_PROTEIN.RUN_ID = RUN.ID WHERE DECOY==0;' , con)
+        if peptides is not None:
+            click.echo("Total peptides (global context) (q-value<%s): %s" % (qt, peptides_global[i]))
+            click.echo(tabulate(per_run(peptides, i), headers=['FILENAME', 'COUNT']))
+            click.echo(10*"=")
 
-            click.echo("Total proteins (global context) (q-value<%s): %s" % (qt, len(proteins_global[proteins_global['QVALUE']<qt][['PROTEIN_ID']].drop_duplicates())))
-            click.echo(tabulate(proteins[proteins['QVALUE']<qt].groupby(['FILENAME'])['PROTEIN_ID'].nunique().reset_index(), showindex=False))
+        if proteins is not None:
+            click.echo("Total proteins (global context) (q-value<%s): %s" % (qt, proteins_global[i]))
+            click.echo(tabulate(per_run(proteins, i), headers=['FILENAME', 'COUNT']))
             click.echo(10*"=")
@@ -10,6 +10,8 @@ import polars as pl
 import sqlite3
 import duckdb
 import pickle
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
 
 from .pyprophet import PyProphet
 from .glyco.scoring import partial_score, combined_score
@@ -27,6 +29,52 @@ except NameError:
         return fun
 
 
+@dataclass(frozen=True)
+class ScoreConfig:
+    """Parameters of a single `pyprophet score` invocation
+    """
+    infile: str
+    outfile: str
+    classifier: str
+    xgb_hyperparams: Optional[Mapping]
+    xgb_params: Optional[Mapping]
+    xgb_params_space: Optional[Mapping]
+    xeval_fraction: float
+    xeval_num_iter: int
+    ss_initial_fdr: float
+    ss_iteration_fdr: float
+    ss_num_iter: int
+    ss_main_score: str
+    group_id: str
+    parametric: bool
+    pfdr: bool
+    pi0_lambda: Any
+    pi0_method: str
+    pi0_smooth_df: int
+    pi0_smooth_log_pi0: bool
+    lfdr_truncate: bool
+    lfdr_monotone: bool
+    lfdr_transformation: str
+    lfdr_adj: float
+    lfdr_eps: float
+    level: str
+    add_alignment_features: bool
+    ipf_max_peakgroup_rank: int
+    ipf_max_peakgroup_pep: float
+    ipf_max_transition_isotope_overlap: float
+    ipf_min_transition_sn: float
+    glyco: bool
+    density_estimator: str
+    grid_size: int
+    tric_chromprob: bool
+    threads: int
+    test: bool
+    ss_score_filter: str
+    color_palette: str
+    main_score_selection_report: bool
+    apply_weights: Optional[str] = None
+
+
 class PyProphetRunner(object):
 
     __metaclass__ = abc.ABCMeta
@@ -34,7 +82,10 @@ class PyProphetRunner(object):
     """Base class for workflow of command line tool
     """
 
-    def __init__(self, infile, outfile, classifier, xgb_hyperparams, xgb_params, xgb_params_space, xeval_fraction, xeval_num_iter, ss_initial_fdr, ss_iteration_fdr, ss_num_iter, ss_main_score, group_id, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, level, add_alignment_features, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn, glyco, density_estimator, grid_size, tric_chromprob, threads, test, ss_score_filter, color_palette, main_score_selection_report):
+    def __init__(self, config):
+        if config.classifier == 'XGBoost' and config.xgb_params is None:
+            raise click.ClickException("XGBoost classifier requires xgb_hyperparams, xgb_params and xgb_params_space to be set.")
+
         def read_tsv(infile):
             table = pd.read_csv(infile, sep="\t")
             return(table)
@@ -53,7 +104,7 @@ class PyProphetRunner(object):
                                     CREATE INDEX IF NOT EXISTS idx_feature_ms2_feature_id ON FEATURE_MS2 (FEATURE_ID);
                                     ''')
 
-                if not glyco:
+                if not config.glyco:
                     table = pd.read_sql_query('''
                                                 SELECT *,
                                                     RUN_ID || '_' || PRECURSOR_ID AS GROUP_ID
@@ -125,7 +176,7 @@ class PyProphetRunner(object):
                                     CREATE INDEX IF NOT EXISTS idx_feature_feature_id ON FEATURE (ID);
                                     CREATE INDEX IF NOT EXISTS idx_feature_ms1_feature_id ON FEATURE_MS1 (FEATURE_ID);
                                     ''')
-                if not glyco:
+                if not config.glyco:
                     table = pd.read_sql_query(
                         """
                         SELECT *,
@@ -288,7 +339,7 @@ class PyProphetRunner(object):
 
                 table = pd.merge(table, ms1_table, how='left', on='FEATURE_ID')
 
-            if add_alignment_features:
+            if config.add_alignment_features:
                 # Append MS2 alignment scores to MS2 table if selected
                 if level == "ms2" or level == "ms1ms2":
                     if not check_sqlite_table(con, "FEATURE_MS2_ALIGNMENT"):
@@ -379,7 +430,7 @@ class PyProphetRunner(object):
                 raise click.ClickException(f"Main score ({ss_main_score.lower()}) column not present in data. Current columns: {table.columns}")
 
             # Enable transition count & precursor / product charge scores for XGBoost-based classifier
-            if classifier == 'XGBoost' and level!='alignment':
+            if config.classifier == 'XGBoost' and level!='alignment':
                 click.echo("Info: Enable number of transitions & precursor / product charge scores for XGBoost-based classifier")
                 table = table.rename(index=str, columns={'precursor_charge': 'var_precursor_charge', 'product_charge': 'var_product_charge', 'transition_count': 'var_transition_count'})
 
@@ -581,13 +632,14 @@ class PyProphetRunner(object):
                 raise click.ClickException(f"Main score ({ss_main_score.lower()}) column not present in data. Current columns: {table.columns}")
 
             # Enable transition count & precursor / product charge scores for XGBoost-based classifier
-            if classifier == 'XGBoost' and level!='alignment':
+            if config.classifier == 'XGBoost' and level!='alignment':
                 click.echo("Info: Enable number of transitions & precursor / product charge scores for XGBoost-based classifier")
                 table = table.rename(index=str, columns={'precursor_charge': 'var_precursor_charge', 'product_charge': 'var_product_charge', 'transition_count': 'var_transition_count'})
 
             return(table)
 
         # Check for auto main score selection
+        ss_main_score = config.ss_main_score
         if ss_main_score=="auto":
             # Set starting default main score
             ss_main_score = "var_xcorr_shape"
@@ -596,56 +648,25 @@ class PyProphetRunner(object):
             use_dynamic_main_score = False
 
         # Main function
+        infile = config.infile
         if is_sqlite_file(infile):
             self.mode = 'osw'
-            self.table = read_osw(infile, level, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn)
+            self.table = read_osw(infile, config.level, config.ipf_max_peakgroup_rank, config.ipf_max_peakgroup_pep, config.ipf_max_transition_isotope_overlap, config.ipf_min_transition_sn)
         elif is_parquet_file(infile):
             self.mode = 'parquet'
-            self.table = read_parquet(infile, level, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn)
+            self.table = read_parquet(infile, config.level, config.ipf_max_peakgroup_rank, config.ipf_max_peakgroup_pep, config.ipf_max_transition_isotope_overlap, config.ipf_min_transition_sn)
         elif is_valid_split_parquet_dir(infile):
             self.mode = 'parquet_split'
-            self.table = read_parquet_dir(infile, level, classifier, ss_main_score, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn)
+            self.table = read_parquet_dir(infile, config.level, config.classifier, ss_main_score, config.ipf_max_peakgroup_rank, config.ipf_max_peakgroup_pep, config.ipf_max_transition_isotope_overlap, config.ipf_min_transition_sn)
         else:
             self.mode = 'tsv'
             self.table = read_tsv(infile)    
 
-        self.infile = infile
-        self.outfile = outfile
-        self.classifier = classifier
-        self.xgb_hyperparams = xgb_hyperparams
-        self.xgb_params = xgb_params
-        self.xgb_params_space = xgb_params_space
-        self.xeval_fraction = xeval_fraction
-        self.xeval_num_iter = xeval_num_iter
-        self.ss_initial_fdr = ss_initial_fdr
-        self.ss_iteration_fdr = ss_iteration_fdr
-        self.ss_num_iter = ss_num_iter
+        self.config = config
         self.ss_main_score = ss_main_score
-        self.group_id = group_id
-        self.parametric = parametric
-        self.pfdr = pfdr
-        self.pi0_lambda = pi0_lambda
-        self.pi0_method = pi0_method
-        self.pi0_smooth_df = pi0_smooth_df
-        self.pi0_smooth_log_pi0 = pi0_smooth_log_pi0
-        self.lfdr_truncate = lfdr_truncate
-        self.lfdr_monotone = lfdr_monotone
-        self.lfdr_transformation = lfdr_transformation
-        self.lfdr_adj = lfdr_adj
-        self.lfdr_eps = lfdr_eps
-        self.level = level
-        self.glyco = glyco
-        self.density_estimator = density_estimator
-        self.grid_size = grid_size
-        self.tric_chromprob = tric_chromprob
-        self.threads = threads
-        self.test = test
-        self.ss_score_filter = ss_score_filter
-        self.color_palette = color_palette
-        self.main_score_selection_report = main_score_selection_report
         self.ss_use_dynamic_main_score = use_dynamic_main_score
 
-        self.prefix = os.path.splitext(outfile)[0]
+        self.prefix = os.path.splitext(config.outfile)[0]
 
     @abc.abstractmethod
     def run_algo(self, part=None):
@@ -659,9 +680,9 @@ class PyProphetRunner(object):
 
         extra_writes = dict(self.extra_writes())
 
-        self.check_cols = [self.group_id, "run_id", "decoy"]
+        self.check_cols = [self.config.group_id, "run_id", "decoy"]
 
-        if self.glyco and self.level in ["ms2", "ms1ms2"]:
+        if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
             start_at = time.time()
 
             start_at_peptide = time.time()
@@ -694,7 +715,7 @@ class PyProphetRunner(object):
             click.echo("-" * 80)
             click.echo("Info: Calculating combined scores")
             (result_combined, weights_combined) = \
-                combined_score(self.group_id, result_peptide, result_glycan)
+                combined_score(self.config.group_id, result_peptide, result_glycan)
 
             if isinstance(weights_combined, pd.DataFrame):
                 click.echo(weights_combined)
@@ -709,18 +730,18 @@ class PyProphetRunner(object):
             click.echo("Info: Calculating error statistics")
             error_stat = ErrorStatisticsCalculator(
                 result_combined,
-                density_estimator=self.density_estimator,
-                grid_size=self.grid_size,
-                parametric=self.parametric,
-                pfdr=self.pfdr,
-                pi0_lambda=self.pi0_lambda, pi0_method=self.pi0_method,
-                pi0_smooth_df=self.pi0_smooth_df,
-                pi0_smooth_log_pi0=self.pi0_smooth_log_pi0,
-                lfdr_truncate=self.lfdr_truncate,
-                lfdr_monotone=self.lfdr_monotone,
-                lfdr_transformation=self.lfdr_transformation,
-                lfdr_adj=self.lfdr_adj, lfdr_eps=self.lfdr_eps,
-                tric_chromprob=self.tric_chromprob,
+                density_estimator=self.config.density_estimator,
+                grid_size=self.config.grid_size,
+                parametric=self.config.parametric,
+                pfdr=self.config.pfdr,
+                pi0_lambda=self.config.pi0_lambda, pi0_method=self.config.pi0_method,
+                pi0_smooth_df=self.config.pi0_smooth_df,
+                pi0_smooth_log_pi0=self.config.pi0_smooth_log_pi0,
+                lfdr_truncate=self.config.lfdr_truncate,
+                lfdr_monotone=self.config.lfdr_monotone,
+                lfdr_transformation=self.config.lfdr_transformation,
+                lfdr_adj=self.config.lfdr_adj, lfdr_eps=self.config.lfdr_eps,
+                tric_chromprob=self.config.tric_chromprob,
             )
             result, pi0 = error_stat.error_statistics()
 
@@ -756,17 +777,17 @@ class PyProphetRunner(object):
         self.print_summary(result)
 
         if self.mode == 'tsv':
-            if self.glyco and self.level in ["ms2", "ms1ms2"]:
+            if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
                 self.save_tsv_results(result, extra_writes, pi0)
             else:
                 self.save_tsv_results(result, extra_writes, scorer.pi0) 
-            if self.classifier == 'LDA':
+            if self.config.classifier == 'LDA':
                 self.save_tsv_weights(weights, extra_writes)
-            elif self.classifier == 'XGBoost':
+            elif self.config.classifier == 'XGBoost':
                 self.save_bin_weights(weights, extra_writes)
 
         elif self.mode == 'osw':
-            if self.glyco and self.level in ["ms2", "ms1ms2"]:
+            if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
                 self.save_osw_results(result, extra_writes, pi0)
             else:
                 self.save_osw_results(result, extra_writes, scorer.pi0)
@@ -774,16 +795,16 @@ class PyProphetRunner(object):
 
         elif self.mode == 'parquet':
             self.save_parquet_results(result, extra_writes, scorer.pi0)
-            if self.classifier == 'LDA':
+            if self.config.classifier == 'LDA':
                 self.save_tsv_weights(weights, extra_writes)
-            elif self.classifier == 'XGBoost':
+            elif self.config.classifier == 'XGBoost':
                 self.save_bin_weights(weights, extra_writes)
 
         elif self.mode == 'parquet_split':
             self.save_parquet_split_results(result, extra_writes, scorer.pi0)
-            if self.classifier == 'LDA':
+            if self.config.classifier == 'LDA':
                 self.save_tsv_weights(weights, extra_writes)
-            elif self.classifier == 'XGBoost':
+            elif self.config.classifier == 'XGBoost':
                 self.save_bin_weights(weights, extra_writes)
 
         seconds = int(needed)
@@ -822,24 +843,24 @@ class PyProphetRunner(object):
             top_targets = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 0)]["d_score"].values
             top_decoys = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 1)]["d_score"].values
 
-            save_report(extra_writes.get("report_path"), output_path, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.color_palette)
+            save_report(extra_writes.get("report_path"), output_path, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.config.color_palette)
             click.echo("Info: %s written." % extra_writes.get("report_path"))
 
     def save_tsv_weights(self, weights, extra_writes):
-        weights['level'] = self.level
+        weights['level'] = self.config.level
         trained_weights_path = extra_writes.get("trained_weights_path")
         if trained_weights_path is not None:
             weights.to_csv(trained_weights_path, sep=",", index=False, mode='a')
             click.echo("Info: %s written." % trained_weights_path)
 
     def save_osw_results(self, result, extra_writes, pi0):
-        if self.infile != self.outfile:
-            copyfile(self.infile, self.outfile)
+        if self.config.infile != self.config.outfile:
+            copyfile(self.config.infile, self.config.outfile)
 
-        con = sqlite3.connect(self.outfile)
+        con = sqlite3.connect(self.config.outfile)
 
-        if self.glyco and self.level in ["ms2", "ms1ms2"]:
-            if self.level == "ms2" or self.level == "ms1ms2":
+        if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
+            if self.config.level == "ms2" or self.config.level == "ms1ms2":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_MS2;')
                 c.execute('DROP TABLE IF EXISTS SCORE_MS2_PART_PEPTIDE;')
@@ -849,7 +870,7 @@ class PyProphetRunner(object):
 
                 table = "SCORE_MS2"
 
-            elif self.level == "ms1":
+            elif self.config.level == "ms1":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_MS1;')
                 c.execute('DROP TABLE IF EXISTS SCORE_MS1_PART_PEPTIDE;')
@@ -874,7 +895,7 @@ class PyProphetRunner(object):
                 df.columns = ['FEATURE_ID','SCORE','PEP']
                 df.to_sql(table + "_PART_" + part.upper(), con, index=False)
         else:
-            if self.level == "ms2" or self.level == "ms1ms2":
+            if self.config.level == "ms2" or self.config.level == "ms1ms2":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_MS2;')
                 con.commit()
@@ -889,7 +910,7 @@ class PyProphetRunner(object):
                     df.columns = ['FEATURE_ID','SCORE','RANK','PVALUE','QVALUE','PEP']
                 table = "SCORE_MS2"
                 df.to_sql(table, con, index=False)
-            elif self.level == "ms1":
+            elif self.config.level == "ms1":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_MS1;')
                 con.commit()
@@ -904,7 +925,7 @@ class PyProphetRunner(object):
                     df.columns = ['FEATURE_ID','SCORE','RANK','PVALUE','QVALUE','PEP']
                 table = "SCORE_MS1"
                 df.to_sql(table, con, index=False)
-            elif self.level == "transition":
+            elif self.config.level == "transition":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_TRANSITION;')
                 con.commit()
@@ -914,7 +935,7 @@ class PyProphetRunner(object):
                 df.columns = ['FEATURE_ID','TRANSITION_ID','SCORE','RANK','PVALUE','QVALUE','PEP']
                 table = "SCORE_TRANSITION"
                 df.to_sql(table, con, index=False)
-            elif self.level == "alignment":
+            elif self.config.level == "alignment":
                 c = con.cursor()
                 c.execute('DROP TABLE IF EXISTS SCORE_ALIGNMENT;')
                 con.commit()
@@ -926,13 +947,13 @@ class PyProphetRunner(object):
                 df.to_sql(table, con, index=False)
 
         con.close()
-        click.echo("Info: %s written." % self.outfile)
+        click.echo("Info: %s written." % self.config.outfile)
 
         if result.final_statistics is not None:
-            if self.glyco and self.level in ["ms2", "ms1ms2"]:
+            if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
                 save_report_glyco(
-                    os.path.join(self.prefix + "_" + self.level + "_report.pdf"),
-                self.outfile + ': ' + self.level + '-level scoring',
+                    os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"),
+                self.config.outfile + ': ' + self.config.level + '-level scoring',
                 result.scored_tables,
                 result.final_statistics,
                 pi0
@@ -946,66 +967,66 @@ class PyProphetRunner(object):
                 top_targets = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 0)]["d_score"].values
                 top_decoys = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 1)]["d_score"].values
 
-                save_report(os.path.join(self.prefix + "_" + self.level + "_report.pdf"), self.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.color_palette)
-            click.echo("Info: %s written." %  os.path.join(self.prefix + "_" + self.level + "_report.pdf"))
+                save_report(os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"), self.config.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.config.color_palette)
+            click.echo("Info: %s written." %  os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"))
 
     def save_osw_weights(self, weights):
-        if self.classifier == "LDA":
-            weights['level'] = self.level
-            con = sqlite3.connect(self.outfile)
+        if self.config.classifier == "LDA":
+            weights['level'] = self.config.level
+            con = sqlite3.connect(self.config.outfile)
 
             c = con.cursor()
-            if self.glyco and self.level in ["ms2", "ms1ms2"]:
+            if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
                 c.execute('SELECT count(name) FROM sqlite_master WHERE type="table" AND name="GLYCOPEPTIDEPROPHET_WEIGHTS";')
                 if c.fetchone()[0] == 1:
-                    c.execute('DELETE FROM GLYCOPEPTIDEPROPHET_WEIGHTS WHERE LEVEL =="%s"' % self.level)
+                    c.execute('DELETE FROM GLYCOPEPTIDEPROPHET_WEIGHTS WHERE LEVEL =="%s"' % self.config.level)
             else:
                 c.execute('SELECT count(name) FROM sqlite_master WHERE type="table" AND name="PYPROPHET_WEIGHTS";')
                 if c.fetchone()[0] == 1:
-                    c.execute('DELETE FROM PYPROPHET_WEIGHTS WHERE LEVEL =="%s"' % self.level)
+                    c.execute('DELETE FROM PYPROPHET_WEIGHTS WHERE LEVEL =="%s"' % self.config.level)
             c.close()
 
             # print(weights)
 
             weights.to_sql("PYPROPHET_WEIGHTS", con, index=False, if_exists='append')
 
-        elif self.classifier == "XGBoost":
-            con = sqlite3.connect(self.outfile)
+        elif self.config.classifier == "XGBoost":
+            con = sqlite3.connect(self.config.outfile)
 
             c = con.cursor()
-            if self.glyco and self.level in ["ms2", "ms1ms2"]:
+            if self.config.glyco and self.config.level in ["ms2", "ms1ms2"]:
                 c.execute('SELECT count(name) FROM sqlite_master WHERE type="table" AND name="GLYCOPEPTIDEPROPHET_XGB";')
                 if c.fetchone()[0] == 1:
-                    c.execute('DELETE FROM GLYCOPEPTIDEPROPHET_XGB WHERE LEVEL =="%s"' % self.level)
+                    c.execute('DELETE FROM GLYCOPEPTIDEPROPHET_XGB WHERE LEVEL =="%s"' % self.config.level)
                 else:
                     c.execute('CREATE TABLE GLYCOPEPTIDEPROPHET_XGB (level TEXT, xgb BLOB)')
 
-                c.execute('INSERT INTO GLYCOPEPTIDEPROPHET_XGB VALUES(?, ?)', [self.level, pickle.dumps(weights)])
+                c.execute('INSERT INTO GLYCOPEPTIDEPROPHET_XGB VALUES(?, ?)', [self.config.level, pickle.dumps(weights)])
             else:
                 c.execute('SELECT count(name) FROM sqlite_master WHERE type="table" AND name="PYPROPHET_XGB";')
                 if c.fetchone()[0] == 1:
-                    c.execute('DELETE FROM PYPROPHET_XGB WHERE LEVEL =="%s"' % self.level)
+                    c.execute('DELETE FROM PYPROPHET_XGB WHERE LEVEL =="%s"' % self.config.level)
                 else:
                     c.execute('CREATE TABLE PYPROPHET_XGB (level TEXT, xgb BLOB)')
 
-                c.execute('INSERT INTO PYPROPHET_XGB VALUES(?, ?)', [self.level, pickle.dumps(weights)])
+                c.execute('INSERT INTO PYPROPHET_XGB VALUES(?, ?)', [self.config.level, pickle.dumps(weights)])
             con.commit()
             c.close()
 
     def save_bin_weights(self, weights, extra_writes):
-        trained_weights_path = extra_writes.get("trained_model_path_" + self.level)
+        trained_weights_path = extra_writes.get("trained_model_path_" + self.config.level)
         if trained_weights_path is not None:
             with open(trained_weights_path, 'wb') as file:
                 self.persisted_weights = pickle.dump(weights, file)
             click.echo("Info: %s written." % trained_weights_path)
 
     def save_parquet_results(self, result, extra_writes, pi0):
-        if self.infile != self.outfile:
-            copyfile(self.infile, self.outfile)
+        if self.config.infile != self.config.outfile:
+            copyfile(self.config.infile, self.config.outfile)
 
-        if self.level == "ms2" or self.level == "ms1ms2":
+        if self.config.level == "ms2" or self.config.level == "ms1ms2":
             # Read the parquet file
-            init_df = pl.read_parquet(self.outfile)
+            init_df = pl.read_parquet(self.config.outfile)
 
             # Check and drop SCORE_MS2_ columns if they exist
             score_ms2_cols = [col for col in init_df.columns if col.startswith("SCORE_MS2_")]
@@ -1038,13 +1059,13 @@ class PyProphetRunner(object):
 
             # Write to parquet
             df.write_parquet(
-                self.outfile,
+                self.config.outfile,
                 compression="zstd",
                 compression_level=11
             )
-        elif self.level == "ms1":
+        elif self.config.level == "ms1":
             # Read the parquet file
-            init_df = pl.read_parquet(self.outfile)
+            init_df = pl.read_parquet(self.config.outfile)
 
             # Check and drop SCORE_MS1_ columns if they exist
             score_ms1_cols = [col for col in init_df.columns if col.startswith("SCORE_MS1_")]
@@ -1095,13 +1116,13 @@ class PyProphetRunner(object):
 
             # Write to parquet
             df.write_parquet(
-                self.outfile,
+                self.config.outfile,
                 compression="zstd",
                 compression_level=11
             )
-        elif self.level == "transition":
+        elif self.config.level == "transition":
             # Read the parquet file
-            init_df = pl.read_parquet(self.outfile)
+            init_df = pl.read_parquet(self.config.outfile)
 
             # Check and drop SCORE_TRANSITION_ columns if they exist
             score_transition_cols = [col for col in init_df.columns if col.startswith("SCORE_TRANSITION_")]
@@ -1173,12 +1194,12 @@ class PyProphetRunner(object):
 
             # Write to parquet
             df.write_parquet(
-                self.outfile,
+                self.config.outfile,
                 compression="zstd",
                 compression_level=11
             )
 
-        click.echo("Info: %s written." % self.outfile)
+        click.echo("Info: %s written." % self.config.outfile)
 
         if result.final_statistics is not None:
             cutoffs = result.final_statistics["cutoff"].values
@@ -1189,15 +1210,15 @@ class PyProphetRunner(object):
             top_targets = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 0)]["d_score"].values
             top_decoys = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 1)]["d_score"].values
 
-            save_report(os.path.join(self.prefix + "_" + self.level + "_report.pdf"), self.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.color_palette)
-            click.echo("Info: %s written." % os.path.join(self.prefix + "_" + self.level + "_report.pdf"))
+            save_report(os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"), self.config.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.config.color_palette)
+            click.echo("Info: %s written." % os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"))
 
     def save_parquet_split_results(self, result, extra_writes, pi0):
-        if self.infile != self.outfile:
-            copyfile(self.infile, self.outfile)
+        if self.config.infile != self.config.outfile:
+            copyfile(self.config.infile, self.config.outfile)
 
-        if self.level == "ms2" or self.level == "ms1ms2":
-            precursor_file = os.path.join(self.outfile, "precursors_features.parquet")
+        if self.config.level == "ms2" or self.config.level == "ms1ms2":
+            precursor_file = os.path.join(self.config.outfile, "precursors_features.parquet")
 
             # Process the result scores
             df = pl.from_pandas(result.scored_tables)
@@ -1251,8 +1272,8 @@ class PyProphetRunner(object):
 
             click.echo("Info: %s written." % precursor_file)
 
-        elif self.level == "ms1":
-            precursor_file = os.path.join(self.outfile, "precursors_features.parquet")
+        elif self.config.level == "ms1":
+            precursor_file = os.path.join(self.config.outfile, "precursors_features.parquet")
 
             # Process the result scores
             df = pl.from_pandas(result.scored_tables)
@@ -1323,8 +1344,8 @@ class PyProphetRunner(object):
             """)
             click.echo("Info: %s written." % precursor_file)
 
-        elif self.level == "transition":
-            transition_file = os.path.join(self.outfile, "transition_features.parquet")
+        elif self.config.level == "transition":
+            transition_file = os.path.join(self.config.outfile, "transition_features.parquet")
 
             # Process the scored tables
             df = pl.DataFrame(result.scored_tables).select([
@@ -1378,8 +1399,8 @@ class PyProphetRunner(object):
 
             click.echo("Info: %s written." % transition_file)
 
-        elif self.level == "alignment":
-            alignment_file = os.path.join(self.outfile, "feature_alignment.parquet")
+        elif self.config.level == "alignment":
+            alignment_file = os.path.join(self.config.outfile, "feature_alignment.parquet")
 
             # Process the scored tables
             df = (
@@ -1455,24 +1476,24 @@ class PyProphetRunner(object):
             top_targets = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 0)]["d_score"].values
             top_decoys = result.scored_tables.loc[(result.scored_tables.peak_group_rank == 1) & (result.scored_tables.decoy == 1)]["d_score"].values
 
-            save_report(os.path.join(self.prefix + "_" + self.level + "_report.pdf"), self.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.color_palette)
-            click.echo("Info: %s written." % os.path.join(self.prefix + "_" + self.level + "_report.pdf"))
+            save_report(os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"), self.config.outfile, top_decoys, top_targets, cutoffs, svalues, qvalues, pvalues, pi0, self.config.color_palette)
+            click.echo("Info: %s written." % os.path.join(self.prefix + "_" + self.config.level + "_report.pdf"))
 
 class PyProphetLearner(PyProphetRunner):
 
     def run_algo(self, part=None):
-        if self.glyco:
-            if self.level in ['ms2', 'ms1ms2'] and part != 'peptide' and part != 'glycan':
+        if self.config.glyco:
+            if self.config.level in ['ms2', 'ms1ms2'] and part != 'peptide' and part != 'glycan':
                 raise click.ClickException("For glycopeptide MS2-level scoring, please specify either 'peptide' or 'glycan' as part.")
             
-            if 'decoy' in self.table.columns and self.level!='transition':
+            if 'decoy' in self.table.columns and self.config.level!='transition':
                 self.table = self.table.drop(columns=['decoy'])
-            if self.level == 'ms2' or self.level == 'ms1ms2':
+            if self.config.level == 'ms2' or self.config.level == 'ms1ms2':
                 self.table = self.table.rename(columns={'decoy_' + part: 'decoy'})
-            elif self.level == 'ms1':
+            elif self.config.level == 'ms1':
                 self.table = self.table.rename(columns={'decoy_glycan': 'decoy'})
             
-        (result, scorer, weights) = PyProphet(self.classifier, self.xgb_hyperparams, self.xgb_params, self.xgb_params_space, self.xeval_fraction, self.xeval_num_iter, self.ss_initial_fdr, self.ss_iteration_fdr, self.ss_num_iter, self.group_id, self.parametric, self.pfdr, self.pi0_lambda, self.pi0_method, self.pi0_smooth_df, self.pi0_smooth_log_pi0, self.lfdr_truncate, self.lfdr_monotone, self.lfdr_transformation, self.lfdr_adj, self.lfdr_eps, self.tric_chromprob, self.threads, self.test, self.ss_score_filter, self.color_palette, self.main_score_selection_report, self.outfile, self.level, self.ss_use_dynamic_main_score).learn_and_apply(self.table)
+        (result, scorer, weights) = PyProphet(self.config.classifier, self.config.xgb_hyperparams, self.config.xgb_params, self.config.xgb_params_space, self.config.xeval_fraction, self.config.xeval_num_iter, self.config.ss_initial_fdr, self.config.ss_iteration_fdr, self.config.ss_num_iter, self.config.group_id, self.config.parametric, self.config.pfdr, self.config.pi0_lambda, self.config.pi0_method, self.config.pi0_smooth_df, self.config.pi0_smooth_log_pi0, self.config.lfdr_truncate, self.config.lfdr_monotone, self.config.lfdr_transformation, self.config.lfdr_adj, self.config.lfdr_eps, self.config.tric_chromprob, self.config.threads, self.config.test, self.config.ss_score_filter, self.config.color_palette, self.config.main_score_selection_report, self.config.outfile, self.config.level, self.ss_use_dynamic_main_score).learn_and_apply(self.table)
         return (result, scorer, weights)
 
     def extra_writes(self):
@@ -1489,47 +1510,48 @@ class PyProphetLearner(PyProphetRunner):
 
 class PyProphetWeightApplier(PyProphetRunner):
 
-    def __init__(self, infile, outfile, classifier, xgb_hyperparams, xgb_params, xgb_params_space, xeval_fraction, xeval_num_iter, ss_initial_fdr, ss_iteration_fdr, ss_num_iter, ss_main_score, group_id, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, level, add_alignment_features, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn, glyco, density_estimator, grid_size, tric_chromprob, threads, test, apply_weights, ss_score_filter, color_palette, main_score_selection_report):
-        super(PyProphetWeightApplier, self).__init__(infile, outfile, classifier, xgb_hyperparams, xgb_params, xgb_params_space, xeval_fraction, xeval_num_iter, ss_initial_fdr, ss_iteration_fdr, ss_num_iter, ss_main_score, group_id, parametric, pfdr, pi0_lambda, pi0_method, pi0_smooth_df, pi0_smooth_log_pi0, lfdr_truncate, lfdr_monotone, lfdr_transformation, lfdr_adj, lfdr_eps, level, add_alignment_features, ipf_max_peakgroup_rank, ipf_max_peakgroup_pep, ipf_max_transition_isotope_overlap, ipf_min_transition_sn, glyco, density_estimator, grid_size, tric_chromprob, threads, test, ss_score_filter, color_palette, main_score_selection_report)
+    def __init__(self, config):
+        super(PyProphetWeightApplier, self).__init__(config)
+        apply_weights = config.apply_weights
         if not os.path.exists(apply_weights):
             raise click.ClickException("Weights file %s does not exist." % apply_weights)
         if self.mode == "tsv":
-            if self.classifier == "LDA":
+            if self.config.classifier == "LDA":
                 try:
                     self.persisted_weights = pd.read_csv(apply_weights, sep=",")
-                    if self.level != self.persisted_weights['level'].unique()[0]:
+                    if self.config.level != self.persisted_weights['level'].unique()[0]:
                         raise click.ClickException("Weights file has wrong level.")
                 except Exception:
                     import traceback
                     traceback.print_exc()
                     raise
-            elif self.classifier == "XGBoost":
+            elif self.config.classifier == "XGBoost":
                 with open(apply_weights, 'rb') as file:
                     self.persisted_weights = pickle.load(file)
         elif self.mode == "osw":
-            if self.classifier == "LDA":
+            if self.config.classifier == "LDA":
                 try:
                     con = sqlite3.connect(apply_weights)
 
                     if not check_sqlite_table(con, "PYPROPHET_WEIGHTS"):
                         raise click.ClickException("PYPROPHET_WEIGHTS table is not present in file, cannot apply weights for LDA classifier! Make sure you have run the scoring on a subset of the data first, or that you supplied the right `--classifier` parameter.")
-                    data = pd.read_sql_query("SELECT * FROM PYPROPHET_WEIGHTS WHERE LEVEL=='%s'" % self.level, con)
+                    data = pd.read_sql_query("SELECT * FROM PYPROPHET_WEIGHTS WHERE LEVEL=='%s'" % self.config.level, con)
                     data.columns = [col.lower() for col in data.columns]
                     con.close()
                     self.persisted_weights = data
-                    if self.level != self.persisted_weights['level'].unique()[0]:
+                    if self.config.level != self.persisted_weights['level'].unique()[0]:
                         raise click.ClickException("Weights file has wrong level.")
                 except Exception:
                     import traceback
                     traceback.print_exc()
                     raise
-            elif self.classifier == "XGBoost":
+            elif self.config.classifier == "XGBoost":
                 try:
                     con = sqlite3.connect(apply_weights)
 
                     if not check_sqlite_table(con, "PYPROPHET_XGB"):
                         raise click.ClickException("PYPROPHET_XGB table is not present in file, cannot apply weights for XGBoost classifier! Make sure you have run the scoring on a subset of the data first, or that you supplied the right `--classifier` parameter.")
-                    data = con.execute("SELECT xgb FROM PYPROPHET_XGB WHERE LEVEL=='%s'" % self.level).fetchone()
+                    data = con.execute("SELECT xgb FROM PYPROPHET_XGB WHERE LEVEL=='%s'" % self.config.level).fetchone()
                     con.close()
                     self.persisted_weights = pickle.loads(data[0])
                 except Exception:
@@ -1538,7 +1560,7 @@ class PyProphetWeightApplier(PyProphetRunner):
                     raise
                 
     def run_algo(self):
-        (result, scorer, weights) = PyProphet(self.classifier, self.xgb_hyperparams, self.xgb_params, self.xgb_params_space, self.xeval_fraction, self.xeval_num_iter, self.ss_initial_fdr, self.ss_iteration_fdr, self.ss_num_iter, self.group_id, self.parametric, self.pfdr, self.pi0_lambda, self.pi0_method, self.pi0_smooth_df, self.pi0_smooth_log_pi0, self.lfdr_truncate, self.lfdr_monotone, self.lfdr_transformation, self.lfdr_adj, self.lfdr_eps, self.tric_chromprob, self.threads, self.test, self.ss_score_filter, self.color_palette, self.main_score_selection_report, self.outfile, self.level, self.ss_use_dynamic_main_score).apply_weights(self.table, self.persisted_weights)
+        (result, scorer, weights) = PyProphet(self.config.classifier, self.config.xgb_hyperparams, self.config.xgb_params, self.config.xgb_params_space, self.config.xeval_fraction, self.config.xeval_num_iter, self.config.ss_initial_fdr, self.config.ss_iteration_fdr, self.config.ss_num_iter, self.config.group_id, self.config.parametric, self.config.pfdr, self.config.pi0_lambda, self.config.pi0_method, self.config.pi0_smooth_df, self.config.pi0_smooth_log_pi0, self.config.lfdr_truncate, self.config.lfdr_monotone, self.config.lfdr_transformation, self.config.lfdr_adj, self.config.lfdr_eps, self.config.tric_chromprob, self.config.threads, self.config.test, self.config.ss_score_filter, self.config.color_palette, self.config.main_score_selection_report, self.config.outfile, self.config.level, self.ss_use_dynamic_main_score).apply_weights(self.table, self.persisted_weights)
         return (result, scorer, weights)
 
     def extra_writes(self):
@@ -0,0 +1,69 @@
+from __future__ import print_function
+
+import os
+import subprocess
+import shutil
+import sys
+
+import sqlite3
+
+import pytest
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+def _run_cmdline(cmdline):
+    stdout = cmdline + "\n"
+    try:
+        stdout += str(subprocess.check_output(cmdline, shell=True,
+                                          stderr=subprocess.STDOUT))
+    except subprocess.CalledProcessError as error:
+        print(error, end="", file=sys.stderr)
+        raise
+    return stdout
+
+
+def _prepare(temp_folder):
+    os.chdir(temp_folder)
+    data_path = os.path.join(DATA_FOLDER, "test_data.osw")
+    shutil.copy(data_path, temp_folder)
+
+    con = sqlite3.connect("test_data.osw")
+    run_id = con.execute("SELECT ID FROM RUN").fetchone()[0]
+    con.close()
+
+    return run_id
+
+
+def _tables(osw):
+    con = sqlite3.connect(osw)
+    tables = {row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    con.close()
+    return tables
+
+
+def test_filter_repeated_options(tmpdir):
+    run_id = _prepare(tmpdir.strpath)
+
+    cmdline = "pyprophet filter --no-remove_decoys --omit_table FEATURE_TRANSITION --omit_tables FEATURE_MS1 --run_id {} test_data.osw".format(run_id)
+    _run_cmdline(cmdline)
+
+    tables = _tables("test_data_filtered.osw")
+    assert "FEATURE_TRANSITION" not in tables
+    assert "FEATURE_MS1" not in tables
+    assert {"FEATURE", "FEATURE_MS2", "PRECURSOR", "TRANSITION", "RUN"} <= tables
+
+    con = sqlite3.connect("test_data_filtered.osw")
+    assert con.execute("SELECT COUNT(*) FROM FEATURE").fetchone()[0] > 0
+    assert con.execute("SELECT ID FROM RUN").fetchall() == [(run_id,)]
+    con.close()
+
+
+def test_filter_rejects_list_literal(tmpdir):
+    _prepare(tmpdir.strpath)
+
+    cmdline = """pyprophet filter --no-remove_decoys --omit_tables '["FEATURE_TRANSITION", "FEATURE_MS1"]' test_data.osw"""
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        subprocess.check_output(cmdline, shell=True, stderr=subprocess.STDOUT)
+
+    assert b"repeat the flag once per value" in error.value.output
+    assert not os.path.exists("test_data_filtered.osw")
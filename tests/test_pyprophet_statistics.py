@@ -0,0 +1,89 @@
+from __future__ import print_function
+
+import os
+import subprocess
+import shutil
+import sys
+
+import sqlite3
+
+import pytest
+
+DATA_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+def _run_cmdline(cmdline):
+    try:
+        stdout = subprocess.check_output(cmdline, shell=True,
+                                         stderr=subprocess.STDOUT).decode()
+    except subprocess.CalledProcessError as error:
+        print(error, end="", file=sys.stderr)
+        raise
+    return stdout
+
+
+def _score(temp_folder):
+    os.chdir(temp_folder)
+    data_path = os.path.join(DATA_FOLDER, "test_data.osw")
+    shutil.copy(data_path, temp_folder)
+    # MS2-level
+    cmdline = "pyprophet score --in=test_data.osw --level=ms2 --test --pi0_lambda=0.001 0 0 --ss_iteration_fdr=0.02"
+
+    # peptide- and protein-level
+    cmdline += " peptide --pi0_lambda=0.001 0 0 --in=test_data.osw --context=run-specific"
+    cmdline += " peptide --pi0_lambda=0.001 0 0 --in=test_data.osw --context=global"
+    cmdline += " protein --pi0_lambda=0 0 0 --in=test_data.osw --context=run-specific"
+    cmdline += " protein --pi0_lambda=0 0 0 --in=test_data.osw --context=global"
+
+    _run_cmdline(cmdline)
+
+    # test_data.osw leaves PROTEIN.DECOY empty, flag decoys from their accession
+    con = sqlite3.connect("test_data.osw")
+    con.execute("UPDATE PROTEIN SET DECOY = PROTEIN_ACCESSION LIKE 'DECOY\\_%' ESCAPE '\\'")
+    con.commit()
+    con.close()
+
+
+def _add_second_run():
+    # Copy part of the target results to a second run with q-values of 0.03, so that run
+    # is reported at q-value<0.05 and q-value<0.1 but left out at q-value<0.01
+    con = sqlite3.connect("test_data.osw")
+    con.executescript('''
+INSERT INTO RUN (ID, FILENAME) VALUES (1, 'second_run.mzML.gz');
+
+CREATE TEMP TABLE F AS SELECT FEATURE.* FROM FEATURE INNER JOIN SCORE_MS2 ON FEATURE.ID = SCORE_MS2.FEATURE_ID WHERE RANK==1 AND QVALUE<0.01 ORDER BY FEATURE.ID LIMIT 50;
+CREATE TEMP TABLE S AS SELECT * FROM SCORE_MS2 WHERE FEATURE_ID IN (SELECT ID FROM F);
+UPDATE F SET ID = ID / 2, RUN_ID = 1;
+UPDATE S SET FEATURE_ID = FEATURE_ID / 2, QVALUE = 0.03;
+INSERT INTO FEATURE SELECT * FROM F;
+INSERT INTO SCORE_MS2 SELECT * FROM S;
+
+CREATE TEMP TABLE P AS SELECT * FROM SCORE_PEPTIDE WHERE CONTEXT=="run-specific" AND QVALUE<0.01 ORDER BY PEPTIDE_ID LIMIT 20;
+UPDATE P SET RUN_ID = 1, QVALUE = 0.03;
+INSERT INTO SCORE_PEPTIDE SELECT * FROM P;
+
+CREATE TEMP TABLE R AS SELECT SCORE_PROTEIN.* FROM SCORE_PROTEIN INNER JOIN PROTEIN ON SCORE_PROTEIN.PROTEIN_ID = PROTEIN.ID WHERE CONTEXT=="run-specific" AND DECOY==0 ORDER BY PROTEIN_ID LIMIT 10;
+UPDATE R SET RUN_ID = 1, QVALUE = 0.03;
+INSERT INTO SCORE_PROTEIN SELECT * FROM R;
+''')
+    con.commit()
+    con.close()
+
+
+def test_statistics_0(tmpdir, regtest):
+    _score(tmpdir.strpath)
+
+    print(_run_cmdline("pyprophet statistics --in=test_data.osw"), file=regtest)
+
+
+def test_statistics_1(tmpdir, regtest):
+    _score(tmpdir.strpath)
+    _add_second_run()
+
+    print(_run_cmdline("pyprophet statistics --in=test_data.osw"), file=regtest)
+
+
+def test_statistics_unscored(tmpdir):
+    os.chdir(tmpdir.strpath)
+    shutil.copy(os.path.join(DATA_FOLDER, "test_data.osw"), tmpdir.strpath)
+
+    assert _run_cmdline("pyprophet statistics --in=test_data.osw") == ""